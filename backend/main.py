@@ -7,12 +7,24 @@ This FastAPI server handles:
 4. Returning transcribed text to frontend
 """
 
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
+from cachetools import LRUCache
+import anyio.to_thread
+import asyncio
+import functools
+import hashlib
+import logging
+import logging.handlers
+import queue
+import httpx
+import orjson
 import os
-from io import BytesIO
-from typing import Optional
+import time
+from types import MappingProxyType
+from typing import Any, Final, Mapping, Optional
 from indic_transliteration import sanscript
 from indic_transliteration.sanscript import transliterate
 from elevenlabs.client import ElevenLabs
@@ -20,104 +32,225 @@ from elevenlabs.client import ElevenLabs
 # Load environment variables from .env file
 load_dotenv()
 
+# Log through a queue so request handlers never block writing to stdout -
+# a background listener thread does the actual I/O. print() takes the
+# process-wide stdout lock and blocks the event loop under load
+_log_queue = queue.Queue(-1)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+
+logger = logging.getLogger("scriptspeak")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
 # Initialize FastAPI app
+# orjson emits native scripts as raw UTF-8 instead of \uXXXX escapes, so
+# Devanagari/Tamil responses are ~3x smaller and much faster to encode
 app = FastAPI(
     title="ScriptSpeak API",
     description="Multilingual voice-to-text API for Indian languages",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Multipart framing (boundaries, headers, the language form field) adds a
+# little on top of the audio bytes, so allow some slack above MAX_UPLOAD_BYTES
+# when judging the raw Content-Length
+_MULTIPART_OVERHEAD: Final[int] = 16 * 1024
+
+
+# Registered BEFORE CORSMiddleware below: Starlette wraps later-added
+# middleware around earlier ones, so this ordering keeps CORS outermost and
+# the 413 gets its Access-Control-Allow-Origin header - otherwise the
+# browser hides the error body from the frontend
+@app.middleware("http")
+async def reject_oversized_bodies(request: Request, call_next) -> Response:
+    """
+    Rejects oversized requests from the Content-Length header alone,
+    before Starlette's multipart parser reads (and spools) a single body
+    byte. The chunked size check inside transcribe_audio still covers
+    clients that omit Content-Length
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit():
+        if int(content_length) > MAX_UPLOAD_BYTES + _MULTIPART_OVERHEAD:
+            return ORJSONResponse(
+                status_code=413,
+                content={"detail": f"Request body too large. Maximum audio size is {MAX_UPLOAD_BYTES} bytes."}
+            )
+    return await call_next(request)
+
+
 # Enable CORS (Cross-Origin Resource Sharing)
-# This allows your React frontend to communicate with this backend
+# This allows your React frontend to communicate with this backend.
+# Pinning origins/methods/headers (instead of "*") lets the middleware take
+# its fast paths, and max_age lets browsers cache the preflight answer for a
+# day - saving one OPTIONS round-trip per upload
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with your frontend URL
+    allow_origins=ALLOWED_ORIGINS,  # Set CORS_ORIGINS to your frontend URL(s) in production
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods (GET, POST, etc.)
-    allow_headers=["*"],  # Allow all headers
+    allow_methods=["GET", "POST"],  # Only the methods the API actually serves
+    allow_headers=["content-type"],
+    max_age=86400,  # Browsers cache the preflight response for 24h
 )
 
+
 # Initialize ElevenLabs client with API key from environment variables
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 
+# Shared HTTP client for all ElevenLabs calls: keep-alive connections mean
+# we pay the TCP+TLS handshake once, not on every request - for short clips
+# the handshake is a large fraction of total latency
+httpx_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=60
+)
+
 # Create ElevenLabs client instance
 if ELEVENLABS_API_KEY:
-    elevenlabs_client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
+    elevenlabs_client: Optional[ElevenLabs] = ElevenLabs(api_key=ELEVENLABS_API_KEY, httpx_client=httpx_client)
 else:
     elevenlabs_client = None
 
-# Mapping of language names to their native scripts
-# This tells the app which script to use for each language
-LANGUAGE_SCRIPT_MAP = {
-    "hindi": "devanagari",
-    "punjabi": "gurmukhi",
-    "gujarati": "gujarati",
-    "bengali": "bengali",
-    "tamil": "tamil",
-    "telugu": "telugu",
-    "kannada": "kannada",
-    "malayalam": "malayalam",
-    "marathi": "devanagari",
-    "urdu": "urdu",
-    "odia": "oriya",
-    "assamese": "bengali",
-    "english": None  # English doesn't need transliteration
-}
-
-# Mapping of language names to ElevenLabs language codes
-# Based on ElevenLabs documentation: https://elevenlabs.io/docs/speech-to-text/supported-languages
-ELEVENLABS_LANGUAGE_CODES = {
-    "hindi": "hin",      # Hindi
-    "punjabi": "pan",    # Punjabi
-    "gujarati": "guj",   # Gujarati
-    "bengali": "ben",    # Bengali
-    "tamil": "tam",      # Tamil
-    "telugu": "tel",     # Telugu
-    "kannada": "kan",    # Kannada
-    "malayalam": "mal",  # Malayalam
-    "marathi": "mar",    # Marathi
-    "urdu": "urd",       # Urdu
-    "odia": "ori",       # Odia
-    "assamese": "asm",   # Assamese
-    "english": "eng"     # English
-}
-
-
-def convert_to_native_script(text: str, language: str) -> str:
+# Maximum allowed size for an uploaded audio file (bytes)
+# Keeps a single oversized upload from exhausting server memory
+MAX_UPLOAD_BYTES: Final[int] = int(os.getenv("MAX_UPLOAD_BYTES", str(25 * 1024 * 1024)))  # 25 MB
+
+# Cap on in-flight ElevenLabs calls: bursts queue here behind a semaphore
+# instead of tripping the API's concurrent-request limit and causing
+# 429-driven retries. Size this to your ElevenLabs plan's concurrency budget
+#
+# Note on batching: the speech-to-text endpoint accepts exactly one file per
+# call, so coalescing queued short clips into one upstream request is not
+# possible. Concurrent handlers draining through this semaphore already give
+# the parallel-dispatch equivalent without adding a batching-window delay
+ELEVENLABS_MAX_CONCURRENCY: Final[int] = int(os.getenv("ELEVENLABS_MAX_CONCURRENCY", "4"))
+
+# How many requests may wait for a semaphore slot before we shed load with
+# a 503 instead of letting the queue grow without bound
+ELEVENLABS_MAX_QUEUE: Final[int] = int(os.getenv("ELEVENLABS_MAX_QUEUE", "32"))
+
+_elevenlabs_semaphore = asyncio.Semaphore(ELEVENLABS_MAX_CONCURRENCY)
+_elevenlabs_pending: int = 0  # requests currently waiting for or holding a slot
+
+# Response cache keyed on (audio content hash, language): re-uploads of the
+# same clip (retries, tests, impatient users) are served from memory without
+# another ElevenLabs round-trip, saving both latency and quota
+TRANSCRIBE_CACHE_SIZE: Final[int] = int(os.getenv("TRANSCRIBE_CACHE_SIZE", "512"))
+_transcribe_cache = LRUCache(maxsize=TRANSCRIBE_CACHE_SIZE)
+
+# What /transcribe should include in its response:
+#   "full"   - both original_text and native_text (default, original behavior)
+#   "native" - only native_text, halving the payload for script-only clients
+#   "latin"  - only original_text, skipping transliteration entirely
+RESPONSE_MODES: Final[frozenset] = frozenset({"full", "native", "latin"})
+
+# Single merged language table: language -> (sanscript script constant,
+# ElevenLabs code). The script constant is resolved here, at import time,
+# so the transcribe path never does getattr/upper() string work - just one
+# dict lookup. None means keep Latin text as-is. Codes are what ElevenLabs
+# expects per https://elevenlabs.io/docs/speech-to-text/supported-languages
+# The tables are wrapped in MappingProxyType: they are lookup tables, not
+# state, and the read-only view guards against accidental mutation
+LANG_INFO: Final[Mapping[str, tuple[Optional[str], str]]] = MappingProxyType({
+    "hindi": (sanscript.DEVANAGARI, "hin"),
+    "punjabi": (sanscript.GURMUKHI, "pan"),
+    "gujarati": (sanscript.GUJARATI, "guj"),
+    "bengali": (sanscript.BENGALI, "ben"),
+    "tamil": (sanscript.TAMIL, "tam"),
+    "telugu": (sanscript.TELUGU, "tel"),
+    "kannada": (sanscript.KANNADA, "kan"),
+    "malayalam": (sanscript.MALAYALAM, "mal"),
+    "marathi": (sanscript.DEVANAGARI, "mar"),
+    # indic-transliteration 2.3.57 registers an "urdu" scheme but ships no
+    # module-level URDU constant, so spell the scheme name out
+    "urdu": ("urdu", "urd"),
+    "odia": (sanscript.ORIYA, "ori"),
+    "assamese": (sanscript.BENGALI, "asm"),
+    "english": (None, "eng")  # English doesn't need transliteration
+})
+
+# Human-readable names shown in the frontend language selector
+LANGUAGE_DISPLAY_NAMES: Final[Mapping[str, str]] = MappingProxyType({
+    "hindi": "Hindi (हिंदी)",
+    "punjabi": "Punjabi (ਪੰਜਾਬੀ)",
+    "gujarati": "Gujarati (ગુજરાતી)",
+    "bengali": "Bengali (বাংলা)",
+    "tamil": "Tamil (தமிழ்)",
+    "telugu": "Telugu (తెలుగు)",
+    "kannada": "Kannada (ಕನ್ನಡ)",
+    "malayalam": "Malayalam (മലയാളം)",
+    "marathi": "Marathi (मराठी)",
+    "urdu": "Urdu (اردو)",
+    "odia": "Odia (ଓଡ଼ିଆ)",
+    "assamese": "Assamese (অসমীয়া)",
+    "english": "English"
+})
+
+# The supported-language list never changes at runtime, so build it (and its
+# JSON encoding) once at import time instead of on every /languages request
+LANGUAGES: Final[tuple[dict[str, str], ...]] = tuple(
+    {
+        "code": lang,
+        "name": LANGUAGE_DISPLAY_NAMES[lang],
+        "script": (script or "latin").capitalize(),
+        "elevenlabs_code": code,
+    }
+    for lang, (script, code) in LANG_INFO.items()
+)
+LANGUAGES_JSON: Final[bytes] = orjson.dumps({"languages": LANGUAGES})
+
+
+@functools.lru_cache(maxsize=4096)
+def _transliterate_cached(text: str, target_script: str) -> str:
+    """
+    ITRANS -> native script conversion, memoized on (text, script)
+
+    Transliteration is a pure function, and users often re-submit the same
+    phrases, so repeat conversions become a dict lookup instead of running
+    the indic-transliteration parser again
+    """
+    return transliterate(text, sanscript.ITRANS, target_script)
+
+
+def convert_to_native_script(text: str, target_script: Optional[str]) -> str:
     """
     Converts text to the appropriate Indian script
-    
+
     Args:
         text: The text to convert (usually in Latin/English script)
-        language: Target language (e.g., "hindi", "tamil")
-    
+        target_script: sanscript script constant from LANG_INFO (None means
+            the language has no native script, e.g. English)
+
     Returns:
         Text in native script (e.g., Devanagari, Tamil script)
     """
-    # Get the target script for this language
-    target_script = LANGUAGE_SCRIPT_MAP.get(language.lower())
-    
-    # If no script mapping exists or language is English, return original text
-    if not target_script or language.lower() == "english":
+    # If no script mapping exists, return original text
+    if target_script is None:
         return text
-    
+
     try:
         # Use indic-transliteration library to convert
         # From ITRANS (Latin representation) to native script
-        converted_text = transliterate(
-            text,
-            sanscript.ITRANS,  # Source: Latin/English representation
-            getattr(sanscript, target_script.upper())  # Target: Native script
-        )
-        return converted_text
+        return _transliterate_cached(text, target_script)
     except Exception as e:
         # If conversion fails, return original text
-        print(f"Transliteration error: {e}")
+        logger.warning("Transliteration error: %s", e)
         return text
 
 
 @app.get("/")
-async def root():
+async def root() -> dict[str, Any]:
     """
     Health check endpoint
     Visit this URL to verify the server is running
@@ -133,54 +266,122 @@ async def root():
 @app.post("/transcribe")
 async def transcribe_audio(
     audio: UploadFile = File(...),  # Audio file from frontend
-    language: str = Form("hindi")    # Target language (default: Hindi)
-):
+    language: str = Form("hindi"),   # Target language (default: Hindi)
+    response_mode: str = Form("full")  # "full", "native" or "latin" (see RESPONSE_MODES)
+) -> dict[str, Any]:
     """
     Main endpoint for speech-to-text transcription
-    
+
     Process:
     1. Receive audio file from frontend
     2. Send to ElevenLabs API for transcription using official SDK
     3. Convert transcribed text to native script
     4. Return result to frontend
+
+    response_mode lets the caller drop the transcript copy it doesn't
+    need: "native" omits original_text, "latin" omits native_text and
+    skips the transliteration work entirely
     """
-    
+    global _elevenlabs_pending
+
     # Validate ElevenLabs client is configured
     if not elevenlabs_client:
         raise HTTPException(
             status_code=500,
             detail="ElevenLabs API key not configured. Please set ELEVENLABS_API_KEY in .env file"
         )
-    
-    try:
-        # Read the uploaded audio file into memory
-        audio_content = await audio.read()
-        
-        # Create a BytesIO object (file-like object in memory)
-        # ElevenLabs SDK expects a file-like object
-        audio_file = BytesIO(audio_content)
-        
-        # Get the ElevenLabs language code for the selected language
-        language_code = ELEVENLABS_LANGUAGE_CODES.get(
-            language.lower(), 
-            "eng"  # Default to English if language not found
+
+    # Normalize the language once and validate it up front - unknown
+    # languages used to silently fall back to English, burning ElevenLabs
+    # quota on what is almost always a typo. casefold() rather than lower()
+    # so canonicalization is locale-safe (e.g. Turkish dotless I)
+    lang = language.casefold()
+    info = LANG_INFO.get(lang)
+    if info is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported language '{language}'. See /languages for the supported list."
         )
+    target_script, language_code = info
+
+    mode = response_mode.casefold()
+    if mode not in RESPONSE_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported response_mode '{response_mode}'. Use one of: full, native, latin."
+        )
+
+    try:
+        # Size-check and hash the upload in a single chunked pass: each 1 MiB
+        # chunk is hashed while it is still hot in cache from the read, so
+        # the hash costs no extra trip over the data, and we bail out the
+        # moment the running size crosses the limit
+        hasher = hashlib.blake2b(digest_size=16)
+        audio_size = 0
+        audio.file.seek(0)
+        while chunk := audio.file.read(1024 * 1024):
+            audio_size += len(chunk)
+            if audio_size > MAX_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Audio file too large. Maximum allowed is {MAX_UPLOAD_BYTES} bytes."
+                )
+            hasher.update(chunk)
+        audio.file.seek(0)
+        # The mode is part of the key because it changes both the payload
+        # shape and how much work the miss path does
+        cache_key = hasher.digest() + f"{lang}:{mode}".encode()
+
+        cached_response = _transcribe_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Serving cached transcription for language: %s", lang)
+            return cached_response
+
+        # Pass the underlying spooled temp file straight to the SDK instead of
+        # copying the whole upload into memory first - memory use stays
+        # constant no matter how long the recording is
+        audio_file = (audio.filename, audio.file, audio.content_type)
+
+        logger.info("Transcribing audio for language: %s (code: %s)", lang, language_code)
         
-        print(f"Transcribing audio for language: {language} (code: {language_code})")
-        
+        # If every slot is busy and the wait queue is already deep, shed
+        # load now rather than stacking up more waiters
+        if _elevenlabs_semaphore.locked() and _elevenlabs_pending >= ELEVENLABS_MAX_CONCURRENCY + ELEVENLABS_MAX_QUEUE:
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy transcribing other requests. Please retry shortly.",
+                headers={"Retry-After": "1"}
+            )
+
         # Use ElevenLabs SDK to transcribe audio
-        # Following the official documentation pattern
-        transcription = elevenlabs_client.speech_to_text.convert(
-            file=audio_file,
-            model_id="scribe_v1",  # Currently only scribe_v1 is supported
-            tag_audio_events=False,  # We don't need audio event tagging
-            language_code=language_code,  # Language of the audio
-            diarize=False  # We don't need speaker diarization
-        )
+        # The SDK call is synchronous, so run it in a worker thread - calling
+        # it directly would block the event loop and serialize every upload
+        # behind the slowest one. The semaphore caps how many calls are in
+        # flight upstream at once
+        _elevenlabs_pending += 1
+        try:
+            async with _elevenlabs_semaphore:
+                transcription = await anyio.to_thread.run_sync(
+                    functools.partial(
+                        elevenlabs_client.speech_to_text.convert,
+                        file=audio_file,
+                        model_id="scribe_v1",  # Currently only scribe_v1 is supported
+                        tag_audio_events=False,  # We don't need audio event tagging
+                        language_code=language_code,  # Language of the audio
+                        diarize=False  # We don't need speaker diarization
+                    )
+                )
+        finally:
+            _elevenlabs_pending -= 1
         
         # Extract the transcribed text from the response
-        # The transcription object has a 'text' attribute
-        transcribed_text = transcription.text if hasattr(transcription, 'text') else str(transcription)
+        # The SDK's return type reliably carries a 'text' attribute; a single
+        # getattr with a default avoids hasattr's try/except machinery.
+        # Fall back to str() only when the attribute is missing - an empty
+        # .text is a real result (silent audio) and must reach the no-speech
+        # check below, not be replaced by the model's repr
+        text_attr = getattr(transcription, "text", None)
+        transcribed_text = str(transcription) if text_attr is None else text_attr
         
         # If no text was detected
         if not transcribed_text or transcribed_text.strip() == "":
@@ -189,28 +390,38 @@ async def transcribe_audio(
                 "message": "No speech detected in audio. Please try speaking more clearly."
             }
         
-        print(f"Transcription successful: {transcribed_text[:50]}...")
+        logger.info("Transcription successful: %s...", transcribed_text[:50])
         
-        # Convert to native script if not English
-        if language.lower() != "english":
-            print(f"Converting to native script for {language}...")
-            native_text = convert_to_native_script(transcribed_text, language)
+        # Convert to native script if this language has one - unless the
+        # caller asked for Latin only, in which case skip the work entirely
+        if mode != "latin" and target_script is not None:
+            logger.info("Converting to native script for %s...", lang)
+            native_text = convert_to_native_script(transcribed_text, target_script)
         else:
             native_text = transcribed_text
-        
-        # Return successful response
-        return {
-            "success": True,
-            "original_text": transcribed_text,  # Latin/English version
-            "native_text": native_text,          # Native script version
-            "language": language,
+
+        # Build the successful response (only the transcript copies the
+        # caller asked for) and remember it for repeat uploads
+        payload: dict[str, Any] = {"success": True}
+        if mode != "native":
+            payload["original_text"] = transcribed_text  # Latin/English version
+        if mode != "latin":
+            payload["native_text"] = native_text  # Native script version
+        payload.update({
+            "language": lang,
             "language_code": language_code,
             "message": "Transcription successful"
-        }
+        })
+        _transcribe_cache[cache_key] = payload
+        return payload
     
+    except HTTPException:
+        # Re-raise our own errors (e.g. the 413 above) untouched
+        raise
+
     except AttributeError as e:
         # Handle SDK attribute errors
-        print(f"ElevenLabs SDK error: {e}")
+        logger.error("ElevenLabs SDK error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error with ElevenLabs SDK: {str(e)}. Please check if you're using the latest SDK version."
@@ -218,7 +429,7 @@ async def transcribe_audio(
     
     except Exception as e:
         # Handle any other errors
-        print(f"Transcription error: {e}")
+        logger.error("Transcription error: %s", e)
         error_message = str(e)
         
         # Check for common errors
@@ -240,30 +451,17 @@ async def transcribe_audio(
 
 
 @app.get("/languages")
-async def get_supported_languages():
+async def get_supported_languages() -> Response:
     """
     Returns list of supported languages
     Frontend can use this to populate language selector
     """
-    return {
-        "languages": [
-            {"code": "hindi", "name": "Hindi (हिंदी)", "script": "Devanagari", "elevenlabs_code": "hin"},
-            {"code": "punjabi", "name": "Punjabi (ਪੰਜਾਬੀ)", "script": "Gurmukhi", "elevenlabs_code": "pan"},
-            {"code": "gujarati", "name": "Gujarati (ગુજરાતી)", "script": "Gujarati", "elevenlabs_code": "guj"},
-            {"code": "bengali", "name": "Bengali (বাংলা)", "script": "Bengali", "elevenlabs_code": "ben"},
-            {"code": "tamil", "name": "Tamil (தமிழ்)", "script": "Tamil", "elevenlabs_code": "tam"},
-            {"code": "telugu", "name": "Telugu (తెలుగు)", "script": "Telugu", "elevenlabs_code": "tel"},
-            {"code": "kannada", "name": "Kannada (ಕನ್ನಡ)", "script": "Kannada", "elevenlabs_code": "kan"},
-            {"code": "malayalam", "name": "Malayalam (മലയാളം)", "script": "Malayalam", "elevenlabs_code": "mal"},
-            {"code": "marathi", "name": "Marathi (मराठी)", "script": "Devanagari", "elevenlabs_code": "mar"},
-            {"code": "urdu", "name": "Urdu (اردو)", "script": "Urdu", "elevenlabs_code": "urd"},
-            {"code": "english", "name": "English", "script": "Latin", "elevenlabs_code": "eng"},
-        ]
-    }
+    # The table is fixed, so serve the JSON bytes encoded once at import time
+    return Response(content=LANGUAGES_JSON, media_type="application/json")
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> dict[str, Any]:
     """
     Detailed health check endpoint
     Shows system status and configuration
@@ -271,13 +469,62 @@ async def health_check():
     return {
         "status": "healthy",
         "elevenlabs_api_configured": elevenlabs_client is not None,
-        "supported_languages": len(ELEVENLABS_LANGUAGE_CODES),
+        "supported_languages": len(LANG_INFO),
+        "transliteration_cache": _transliterate_cached.cache_info()._asdict(),
         "version": "1.0.0"
     }
 
 
+@app.on_event("startup")
+async def warmup() -> None:
+    """
+    Pre-pay one-time costs before serving traffic
+    The first transliteration builds indic-transliteration's scheme tables
+    and the first HTTPS call pays DNS + TLS handshake; doing both here
+    keeps the first real request on the warm path
+    """
+    started = time.perf_counter()
+
+    # Force indic-transliteration to build its scheme tables now
+    transliterate("a", sanscript.ITRANS, sanscript.DEVANAGARI)
+
+    # Prime DNS and a TLS keep-alive connection to the ElevenLabs API
+    # (the response body doesn't matter, only the warm connection)
+    if elevenlabs_client:
+        try:
+            await anyio.to_thread.run_sync(
+                functools.partial(httpx_client.get, "https://api.elevenlabs.io/v1/models")
+            )
+        except Exception as e:
+            logger.warning("Warmup request to ElevenLabs failed (non-fatal): %s", e)
+
+    logger.info("Warmup finished in %.2fs", time.perf_counter() - started)
+
+
+@app.on_event("shutdown")
+def close_http_client() -> None:
+    """
+    Close the shared HTTP client on shutdown
+    Makes sure keep-alive connections to ElevenLabs are torn down cleanly
+    """
+    httpx_client.close()
+
+
 # Run the server when this file is executed directly
 if __name__ == "__main__":
     import uvicorn
     # Run on port 8000, accessible from all network interfaces
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # One worker per CPU plus uvloop/httptools (both ship with
+    # uvicorn[standard]) so uploads scale across cores instead of queueing
+    # on a single asyncio loop. Note that ELEVENLABS_MAX_CONCURRENCY is a
+    # per-worker limit, so divide your plan's concurrency budget by the
+    # worker count when setting it
+    uvicorn.run(
+        "main:app",  # Import string required for multi-worker mode
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        log_level="info"
+    )
\ No newline at end of file